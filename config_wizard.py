@@ -11,34 +11,42 @@ Helps users create a good config.yaml file by:
 """
 
 import os
+import re
 import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict
 import yaml
 import json
-from dataclasses import dataclass
-from copy import deepcopy
-
-from textual.app import ComposeResult, App
-from textual.widgets import Header, Footer, Static, Button, Input, Label, RichLog
-from textual.containers import Container, Vertical, Horizontal
-from textual.screen import Screen
-from textual.binding import Binding
-from rich.text import Text
-from rich.table import Table
-from rich import box
+
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 # Import from lib
 sys.path.insert(0, str(Path(__file__).parent))
 from lib import (
     ConfigManager,
-    find_profile_files,
     generate_new_filename,
 )
 from lib.pattern_matching import format_paper_type
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ (~3x smaller objects); these
+# classes are instantiated once per profile file
+_DATACLASS_KWARGS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_KWARGS)
 class ProfileFile:
     """Represents a profile file and its detection status"""
     path: Path
@@ -51,7 +59,7 @@ class ProfileFile:
     match_priority: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class UserMapping:
     """A user-defined mapping from filename to profile metadata"""
     filename: str
@@ -59,22 +67,19 @@ class UserMapping:
     brand: str
     paper_type: str
     is_pattern: bool = False  # True if this should be converted to a pattern
+    ext: str = ''  # File extension without the dot, captured at creation
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class PatternReplacement:
     """A pattern-based replacement for detecting printer or brand from filenames"""
     original_text: str  # Text in filename to match
     replacement: str   # What to replace it with (canonical name)
     replacement_type: str  # "printer" or "brand"
-    example_filenames: List[str] = None  # Example filenames for this pattern
-    
-    def __post_init__(self):
-        if self.example_filenames is None:
-            self.example_filenames = []
+    example_filenames: List[str] = field(default_factory=list)  # Example filenames for this pattern
 
 
-@dataclass
+@dataclass(**_DATACLASS_KWARGS)
 class FileGroup:
     """A group of files sharing similar detection characteristics"""
     representative_file: str  # One example filename
@@ -82,15 +87,62 @@ class FileGroup:
     detected_printer: Optional[str] = None
     detected_brand: Optional[str] = None
     pattern_similarity: str = ""  # Description of what's similar
+    paper_types: List[str] = field(default_factory=list)  # Parallel to files
+
+
+# Profile file types recognized by the wizard
+PROFILE_SUFFIXES = ('.icc', '.icm', '.emy2')
+
+# Delimiters used to split a filename into its leading prefix
+_PREFIX_SPLIT = re.compile(r'[ _-]')
+
+# List-item prefix for per-file display loops; built once rather than
+# re-embedded through an f-string per iteration
+_BULLET = "  • "
+
+
+def iter_profile_files(root):
+    """Recursively yield profile files under root using os.scandir.
+
+    DirEntry objects carry type information from the directory read, so no
+    extra stat() call is needed per entry; Path objects are only built for
+    files that actually match a profile extension.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('._'):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_profile_files(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+            except OSError:
+                continue
+            if entry.name.lower().endswith(PROFILE_SUFFIXES):
+                yield Path(entry.path)
 
 
 class ConfigWizard:
     """Manages configuration building process"""
 
-    def __init__(self, profiles_dir: Optional[Path] = None):
+    def __init__(self, profiles_dir: Optional[Path] = None,
+                 config_manager: Optional[ConfigManager] = None):
         self.profiles_dir = profiles_dir or Path.cwd()
-        self.config_manager = ConfigManager()
-        self.config_manager.load()  # Load defaults.yaml and config.yaml
+        # Plain-string form for os.scandir, which takes strings directly
+        self.profiles_dir_str = os.fspath(self.profiles_dir)
+        if config_manager is not None:
+            # Reuse an already-loaded manager (the app shares one) instead
+            # of re-reading and re-parsing the YAML config per wizard
+            self.config_manager = config_manager
+        else:
+            self.config_manager = ConfigManager()
+            self.config_manager.load()  # Load defaults.yaml and config.yaml
         self.detected_files: List[ProfileFile] = []
         self.undetected_files: List[ProfileFile] = []
         self.user_mappings: List[UserMapping] = []
@@ -98,54 +150,202 @@ class ConfigWizard:
         self.generated_patterns: List[Dict] = []  # Generated filename patterns
         self.printer_names: Dict[str, List[str]] = {}
         self.brand_mappings: Dict[str, List[str]] = {}
+        self._match_cache: Dict[str, Optional[tuple]] = {}
+        self._analyze_cache: Dict[str, Dict[str, Optional[str]]] = {}
+        # Classification results from previous scans, keyed by
+        # (filename, config hash) so entries survive rescans until the
+        # effective configuration changes
+        self._scan_cache: Dict[Tuple[str, int], Tuple] = {}
+        self._config_hash: Optional[int] = None
+        # (path, config hash) of the last successful save, so repeated
+        # saves of identical content skip the disk write
+        self._last_saved: Optional[Tuple[str, int]] = None
+        # (directory mtime_ns, config hash) of the last completed scan;
+        # lets a repeat scan of an untouched directory return immediately
+        self._last_scan_key: Optional[Tuple[int, int]] = None
+        self._build_brand_index()
+
+    def _current_config_hash(self) -> int:
+        """Hash of the effective configuration, used to key cached scan results."""
+        if self._config_hash is None:
+            dump = yaml.dump(self.build_config_dict(), Dumper=_YamlDumper, sort_keys=True)
+            self._config_hash = hash(dump)
+        return self._config_hash
+
+    def _cached_match(self, filename: str) -> Optional[tuple]:
+        """Run ConfigManager.match_filename with per-filename memoization.
+
+        The pattern pipeline is deterministic for a given configuration, so
+        repeat lookups (scan + grouping passes) become dict reads. The cache
+        is cleared whenever mappings or patterns change.
+        """
+        if filename in self._match_cache:
+            return self._match_cache[filename]
+        result = self.config_manager.match_filename(filename)
+        self._match_cache[filename] = result
+        return result
+
+    def _build_brand_index(self) -> None:
+        """Build the printer/brand alias lookup used for fallback detection.
+
+        Compiles all known brand aliases and printer keys (plus any pattern
+        replacements added during this session) into one Aho-Corasick
+        automaton with (kind, canonical) payloads, so a single sweep over a
+        filename yields both printer and brand hits. Falls back to a
+        combined regex (brands) plus a longest-first alias list (printers)
+        when pyahocorasick is unavailable.
+        """
+        brand_items = [
+            (alias.lower(), canonical)
+            for alias, canonical in self.config_manager.BRAND_NAME_MAPPINGS.items()
+        ]
+        brand_items.extend((brand.lower(), brand) for brand in self.config_manager.PAPER_BRANDS)
+        brand_items.extend(
+            (replacement.original_text.lower(), replacement.replacement)
+            for replacement in self.pattern_replacements
+            if replacement.replacement_type == "brand"
+        )
+        printer_items = [
+            (key.lower(), full_name)
+            for key, full_name in self.config_manager.PRINTER_NAMES.items()
+        ]
+        printer_items.extend(
+            (replacement.original_text.lower(), replacement.replacement)
+            for replacement in self.pattern_replacements
+            if replacement.replacement_type == "printer"
+        )
+        self._brand_items = brand_items
+        self._alias_to_canonical = {alias_lower: canonical for alias_lower, canonical in brand_items}
+        # Longest aliases first so the alternation prefers the most specific match
+        self._brand_regex = re.compile(
+            "|".join(
+                re.escape(alias_lower)
+                for alias_lower in sorted(self._alias_to_canonical, key=len, reverse=True)
+            ),
+            re.IGNORECASE,
+        ) if brand_items else None
+        # Longest printer alias first so the first substring hit wins
+        self._printer_items = sorted(printer_items, key=lambda item: len(item[0]), reverse=True)
+        self._alias_ac = None
+        if HAS_AHOCORASICK:
+            automaton = ahocorasick.Automaton()
+            for alias_lower, canonical in brand_items:
+                automaton.add_word(alias_lower, (len(alias_lower), "brand", canonical))
+            for alias_lower, canonical in printer_items:
+                automaton.add_word(alias_lower, (len(alias_lower), "printer", canonical))
+            automaton.make_automaton()
+            self._alias_ac = automaton
+
+    def _extract_all(self, filename: str) -> Dict[str, Optional[str]]:
+        """Detect printer and brand from a filename in one linear pass.
+
+        Returns a dict with 'printer' and 'brand' keys; the longest matching
+        alias per kind wins.
+        """
+        filename_lower = filename.lower()
+        found: Dict[str, Optional[str]] = {"printer": None, "brand": None}
+
+        if self._alias_ac is not None:
+            best_len = {"printer": 0, "brand": 0}
+            for _, (length, kind, canonical) in self._alias_ac.iter(filename_lower):
+                if length > best_len[kind]:
+                    best_len[kind] = length
+                    found[kind] = canonical
+            return found
+
+        if self._brand_regex is not None:
+            match = self._brand_regex.search(filename_lower)
+            if match:
+                found["brand"] = self._alias_to_canonical[match.group(0)]
+        for alias_lower, canonical in self._printer_items:
+            if alias_lower in filename_lower:
+                found["printer"] = canonical
+                break
+        return found
 
     def scan_profiles(self) -> None:
         """Scan the profiles directory and detect all profile files"""
+        # Skip the walk entirely when both the directory and the effective
+        # config are unchanged since the last scan. The mtime only reflects
+        # the top-level directory, so files edited deep in the tree between
+        # scans aren't noticed here — acceptable for the fix-undetected
+        # loop, where rescans are triggered by config changes (which rotate
+        # the key) rather than filesystem changes.
+        scan_key = None
+        try:
+            scan_key = (
+                os.stat(self.profiles_dir_str).st_mtime_ns,
+                self._current_config_hash(),
+            )
+        except OSError:
+            pass
+        if scan_key is not None and scan_key == self._last_scan_key:
+            return
+
         self.detected_files = []
         self.undetected_files = []
 
-        # Use lib function to find all profile files
-        profile_files = find_profile_files(self.profiles_dir)
-
-        # Flatten the dict into a single list
-        all_files = []
-        for file_list in profile_files.values():
-            all_files.extend(file_list)
+        # Each filename classifies independently, so stream the os.scandir
+        # walk straight into a thread pool and collect results in order; the
+        # full file list is never materialized
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+            for profile in executor.map(
+                self._classify, iter_profile_files(self.profiles_dir_str), chunksize=64
+            ):
+                if profile.detected:
+                    self.detected_files.append(profile)
+                else:
+                    self.undetected_files.append(profile)
+
+        self._last_scan_key = scan_key
+
+    def _classify(self, filepath: Path) -> ProfileFile:
+        """Classify a single profile file as detected or undetected"""
+        filename = filepath.name
+
+        cache_key = (filename, self._current_config_hash())
+        cached = self._scan_cache.get(cache_key)
+        if cached is not None:
+            detected, printer, brand, paper_type = cached
+            return ProfileFile(
+                path=filepath,
+                filename=filename,
+                detected=detected,
+                printer=printer,
+                brand=brand,
+                paper_type=paper_type,
+            )
 
-        # Categorize each file as detected or undetected
-        for filepath in all_files:
-            filename = filepath.name
+        profile = self._classify_uncached(filepath, filename)
+        self._scan_cache[cache_key] = (
+            profile.detected, profile.printer, profile.brand, profile.paper_type
+        )
+        return profile
 
-            try:
-                result = self.config_manager.match_filename(filename)
-                if result and all(result):
-                    printer, brand, paper_type = result
-                    # If brand is "Unknown", try fallback detection
-                    if brand == "Unknown":
-                        brand = self._try_detect_brand_from_filename(filename)
-                    # Treat "Unknown" values as undetected
-                    if printer == "Unknown" or brand == "Unknown" or not brand:
-                        self.undetected_files.append(
-                            ProfileFile(path=filepath, filename=filename, detected=False)
-                        )
-                    else:
-                        profile = ProfileFile(
-                            path=filepath,
-                            filename=filename,
-                            detected=True,
-                            printer=printer,
-                            brand=brand,
-                            paper_type=paper_type,
-                        )
-                        self.detected_files.append(profile)
-                else:
-                    self.undetected_files.append(
-                        ProfileFile(path=filepath, filename=filename, detected=False)
-                    )
-            except Exception:
-                self.undetected_files.append(
-                    ProfileFile(path=filepath, filename=filename, detected=False)
+    def _classify_uncached(self, filepath: Path, filename: str) -> ProfileFile:
+        """Run the full detection pipeline for a single file"""
+        try:
+            result = self._cached_match(filename)
+            if result and all(result):
+                printer, brand, paper_type = result
+                # If brand is "Unknown", try fallback detection
+                if brand == "Unknown":
+                    brand = self._try_detect_brand_from_filename(filename)
+                # Treat "Unknown" values as undetected
+                if printer == "Unknown" or brand == "Unknown" or not brand:
+                    return ProfileFile(path=filepath, filename=filename, detected=False)
+                return ProfileFile(
+                    path=filepath,
+                    filename=filename,
+                    detected=True,
+                    printer=printer,
+                    brand=brand,
+                    paper_type=paper_type,
                 )
+        except Exception:
+            pass
+
+        return ProfileFile(path=filepath, filename=filename, detected=False)
 
     def get_detection_rate(self) -> Tuple[int, int, float]:
         """Return (detected, total, percentage)"""
@@ -190,7 +390,9 @@ class ConfigWizard:
             # Create a grouping key based on detected patterns
             # Group by: (detected_printer, detected_brand, file_prefix, extension)
             prefix = self._extract_prefix(filename)
-            ext = Path(filename).suffix.lower()
+            # Plain string slicing instead of constructing a PurePath
+            dot = filename.rfind('.')
+            ext = filename[dot:].lower() if dot > 0 else ''
 
             group_key = (
                 detected.get("printer"),
@@ -199,23 +401,38 @@ class ConfigWizard:
                 ext
             )
 
-            if group_key not in groups:
+            # Resolve the paper type once, while the analysis is at hand,
+            # so saving a group later doesn't have to re-analyze each file
+            paper_type = detected.get("paper_type")
+            if not paper_type:
+                dot_pos = filename.rfind('.')
+                stem = filename[:dot_pos] if dot_pos > 0 else filename
+                paper_type = format_paper_type(stem)
+
+            group = groups.get(group_key)
+            if group is None:
                 # Create new group
                 groups[group_key] = FileGroup(
                     representative_file=filename,
                     files=[profile_file],
                     detected_printer=detected.get("printer"),
                     detected_brand=detected.get("brand"),
-                    pattern_similarity=self._describe_pattern(prefix, ext, detected)
+                    pattern_similarity=self._describe_pattern(prefix, ext, detected),
+                    paper_types=[paper_type],
                 )
             else:
                 # Add to existing group
-                groups[group_key].files.append(profile_file)
+                group.files.append(profile_file)
+                group.paper_types.append(paper_type)
 
         return list(groups.values())
 
     def _analyze_file(self, filename: str) -> Dict[str, Optional[str]]:
         """Analyze a single filename and return detected fields using ConfigManager"""
+        hit = self._analyze_cache.get(filename)
+        if hit is not None:
+            return hit
+
         detected = {
             "printer": None,
             "brand": None,
@@ -224,7 +441,7 @@ class ConfigWizard:
 
         # Use ConfigManager's pattern matching - this is the single source of truth
         try:
-            result = self.config_manager.match_filename(filename)
+            result = self._cached_match(filename)
             if result and any(result):
                 printer, brand, paper_type = result
                 # Don't treat "Unknown" as detected
@@ -232,47 +449,33 @@ class ConfigWizard:
                     detected["printer"] = printer
                 if brand and brand != "Unknown":
                     detected["brand"] = brand
-                else:
-                    # Try to detect brand from filename if pattern matcher returned "Unknown"
-                    detected["brand"] = self._try_detect_brand_from_filename(filename)
                 if paper_type:
                     detected["paper_type"] = paper_type
+            if detected["printer"] is None or detected["brand"] is None:
+                # One alias sweep fills whichever fields the patterns missed
+                fallback = self._extract_all(filename)
+                if detected["printer"] is None:
+                    detected["printer"] = fallback["printer"]
+                if detected["brand"] is None:
+                    detected["brand"] = fallback["brand"]
         except Exception:
             pass
 
+        self._analyze_cache[filename] = detected
         return detected
 
     def _try_detect_brand_from_filename(self, filename: str) -> Optional[str]:
         """Try to detect brand from filename by searching for known brand names"""
-        filename_lower = filename.lower()
-        
-        # Get all known brand names and their aliases
-        brand_mappings = self.config_manager.BRAND_NAME_MAPPINGS
-        
-        # Search for brand names in filename (case-insensitive)
-        # Check both canonical names and aliases
-        for alias, canonical in brand_mappings.items():
-            if alias.lower() in filename_lower:
-                return canonical
-        
-        # Also check paper_brands list for any brands not in mappings
-        for brand in self.config_manager.PAPER_BRANDS:
-            if brand.lower() in filename_lower:
-                return brand
-        
-        return None
+        return self._extract_all(filename)["brand"]
 
     def _extract_prefix(self, filename: str) -> str:
         """Extract a common prefix from filename (before first space or underscore)"""
-        # Remove extension
-        name = Path(filename).stem
+        # Remove extension (string op; avoids a PurePath allocation)
+        dot = filename.rfind('.')
+        name = filename[:dot] if dot > 0 else filename
 
-        # Split on common delimiters
-        for delimiter in [' ', '_', '-']:
-            if delimiter in name:
-                return name.split(delimiter)[0]
-
-        return name
+        # One C-level scan over all delimiters at once
+        return _PREFIX_SPLIT.split(name, maxsplit=1)[0]
 
     def _describe_pattern(self, prefix: str, ext: str, detected: Dict) -> str:
         """Create a human-readable description of the pattern"""
@@ -300,22 +503,38 @@ class ConfigWizard:
     def add_user_mapping(self, mapping: UserMapping) -> None:
         """Add a user-defined mapping"""
         self.user_mappings.append(mapping)
+        self._config_hash = None
+
+    def add_user_mappings(self, mappings: List[UserMapping]) -> None:
+        """Add several user-defined mappings with a single cache invalidation"""
+        self.user_mappings.extend(mappings)
+        self._config_hash = None
 
     def add_pattern_replacement(self, replacement: PatternReplacement) -> None:
         """Add a pattern-based replacement for detecting printer or brand"""
         self.pattern_replacements.append(replacement)
+        self._match_cache.clear()
+        self._analyze_cache.clear()
+        self._config_hash = None
+        if replacement.replacement_type in ("brand", "printer"):
+            # New aliases need to be folded into the lookup automaton
+            self._build_brand_index()
 
     def add_generated_pattern(self, pattern: Dict) -> None:
         """Add a generated filename pattern"""
         self.generated_patterns.append(pattern)
+        self._match_cache.clear()
+        self._analyze_cache.clear()
+        self._config_hash = None
 
 
     def _analyze_filename_structure(self, filename: str, printer_orig: Optional[str], 
                                     brand_orig: Optional[str], printer_repl: Optional[str],
                                     brand_repl: Optional[str]) -> Optional[Dict]:
         """Analyze filename structure and create a pattern definition"""
-        # Remove extension
-        name_without_ext = Path(filename).stem
+        # Remove extension (string op; avoids a PurePath allocation)
+        dot = filename.rfind('.')
+        name_without_ext = filename[:dot] if dot > 0 else filename
         original_filename = name_without_ext
         
         # Determine delimiter (space, dash, or underscore)
@@ -396,32 +615,7 @@ class ConfigWizard:
             # Neither found, use fallback
             structure.append({"field": "printer", "match_type": "key_search"})
             structure.append({"field": "paper_type", "position": "remaining"})
-        
-        # Build structure based on what we found
-        # For paper type extraction, we'll use a custom approach that removes both brand and printer
-        if brand_first and printer_start is not None:
-            # Format: [Brand] [Paper Type] [Printer]
-            # Use brand as prefix, then extract paper type before printer
-            structure.append({"field": "printer", "match_type": "key_search"})
-            structure.append({"field": "paper_type", "position": "before_printer"})
-        elif printer_first and brand_start is not None:
-            # Format: [Printer] [Paper Type] [Brand]
-            structure.append({"field": "printer", "match_type": "key_search"})
-            structure.append({"field": "brand", "match_type": "substring"})
-            structure.append({"field": "paper_type", "position": "remaining"})
-        elif brand_start is not None:
-            # Only brand found: [Brand] [Paper Type] [Printer?]
-            structure.append({"field": "printer", "match_type": "key_search"})
-            structure.append({"field": "paper_type", "position": "before_printer"})
-        elif printer_start is not None:
-            # Only printer found: [Paper Type] [Printer]
-            structure.append({"field": "printer", "match_type": "key_search"})
-            structure.append({"field": "paper_type", "position": "before_printer"})
-        else:
-            # Neither found, use fallback
-            structure.append({"field": "printer", "match_type": "key_search"})
-            structure.append({"field": "paper_type", "position": "remaining"})
-        
+
         # Determine prefix (if brand is at the start)
         prefix = None
         prefix_case_insensitive = False
@@ -495,49 +689,49 @@ class ConfigWizard:
 
     def build_config_dict(self) -> dict:
         """Build a complete config.yaml structure from user mappings"""
-        # Load existing config to merge with new mappings
-        existing_config = deepcopy(self.config_manager.config) if self.config_manager.config else {}
-        
+        # Merge with the existing config; shallow copies of the top-level
+        # containers are enough (nested lists are copied on write below), so
+        # the full deepcopy traversal is avoided
+        existing_config = self.config_manager.config or {}
+
         config = {
-            "printer_names": existing_config.get("printer_names", {}),
-            "brand_name_mappings": existing_config.get("brand_name_mappings", {}),
-            "paper_brands": existing_config.get("paper_brands", []),
-            "printer_remappings": existing_config.get("printer_remappings", {}),
-            "filename_patterns": existing_config.get("filename_patterns", []),
+            "printer_names": dict(existing_config.get("printer_names") or {}),
+            "brand_name_mappings": dict(existing_config.get("brand_name_mappings") or {}),
+            "paper_brands": list(existing_config.get("paper_brands") or []),
+            "printer_remappings": dict(existing_config.get("printer_remappings") or {}),
+            "filename_patterns": list(existing_config.get("filename_patterns") or []),
         }
 
-        # Ensure we have dicts/lists (not None)
-        if config["printer_names"] is None:
-            config["printer_names"] = {}
-        if config["brand_name_mappings"] is None:
-            config["brand_name_mappings"] = {}
-        if config["paper_brands"] is None:
-            config["paper_brands"] = []
-        if config["printer_remappings"] is None:
-            config["printer_remappings"] = {}
-        if config["filename_patterns"] is None:
-            config["filename_patterns"] = []
-
-        # Add pattern-based replacements to printer_names and brand_name_mappings
+        # Companion set for O(1) membership checks; the list keeps its order
+        paper_brands_set = set(config["paper_brands"])
+
+        # Add pattern-based replacements to printer_names and brand_name_mappings.
+        # Accumulate new aliases per canonical name as sets first, then merge
+        # each touched entry once — set difference replaces a per-replacement
+        # list membership scan and list copy.
+        new_printer_aliases: Dict[str, set] = defaultdict(set)
+        new_brand_aliases: Dict[str, set] = defaultdict(set)
         for replacement in self.pattern_replacements:
             if replacement.replacement_type == "printer":
-                # Add original_text as an alias for replacement (canonical name)
-                if replacement.replacement not in config["printer_names"]:
-                    config["printer_names"][replacement.replacement] = []
-                # Add original_text as an alias if not already present
-                if replacement.original_text not in config["printer_names"][replacement.replacement]:
-                    config["printer_names"][replacement.replacement].append(replacement.original_text)
+                new_printer_aliases[replacement.replacement].add(replacement.original_text)
             elif replacement.replacement_type == "brand":
-                # Add original_text as an alias for replacement (canonical name)
-                if replacement.replacement not in config["brand_name_mappings"]:
-                    config["brand_name_mappings"][replacement.replacement] = []
-                # Add original_text as an alias if not already present
-                if replacement.original_text not in config["brand_name_mappings"][replacement.replacement]:
-                    config["brand_name_mappings"][replacement.replacement].append(replacement.original_text)
+                new_brand_aliases[replacement.replacement].add(replacement.original_text)
                 # Also add to paper_brands if not present
-                if replacement.replacement not in config["paper_brands"]:
+                if replacement.replacement not in paper_brands_set:
+                    paper_brands_set.add(replacement.replacement)
                     config["paper_brands"].append(replacement.replacement)
 
+        for target, additions in (
+            ("printer_names", new_printer_aliases),
+            ("brand_name_mappings", new_brand_aliases),
+        ):
+            for canonical, texts in additions.items():
+                aliases = config[target].get(canonical) or []
+                missing = texts.difference(aliases)
+                if missing:
+                    # Copy-on-write keeps the loaded config's lists untouched
+                    config[target][canonical] = aliases + sorted(missing)
+
         # Extract printer name aliases from user mappings
         for mapping in self.user_mappings:
             if mapping.printer not in config["printer_names"]:
@@ -548,14 +742,16 @@ class ConfigWizard:
             if mapping.brand not in config["brand_name_mappings"]:
                 config["brand_name_mappings"][mapping.brand] = [mapping.brand]
             # Also add to paper_brands if not present
-            if mapping.brand not in config["paper_brands"]:
+            if mapping.brand not in paper_brands_set:
+                paper_brands_set.add(mapping.brand)
                 config["paper_brands"].append(mapping.brand)
 
-        # Add generated filename patterns
+        # Add generated filename patterns, deduplicated by name
+        existing_names = {p.get("name") for p in config["filename_patterns"]}
         for pattern in self.generated_patterns:
-            # Check if pattern already exists (by name)
-            existing_names = [p.get("name") for p in config["filename_patterns"]]
-            if pattern.get("name") not in existing_names:
+            name = pattern.get("name")
+            if name not in existing_names:
+                existing_names.add(name)
                 config["filename_patterns"].append(pattern)
 
         # Sort patterns by priority (highest first)
@@ -566,650 +762,739 @@ class ConfigWizard:
     def save_config(self, output_path: Path = Path("config.yaml")) -> bool:
         """Save the configuration to a YAML file"""
         try:
+            save_key = (os.fspath(output_path), self._current_config_hash())
+            if save_key == self._last_saved:
+                # Nothing changed since the last save to this path
+                return True
             config = self.build_config_dict()
+            # Serialize to a string first so the file sees one write call
+            # instead of the dumper's per-event chunks
+            data = yaml.dump(config, Dumper=_YamlDumper, default_flow_style=False, sort_keys=True)
             with open(output_path, "w") as f:
-                yaml.dump(config, f, default_flow_style=False, sort_keys=True)
+                f.write(data)
+            self._last_saved = save_key
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
             return False
 
 
-class WelcomeScreen(Screen):
-    """Initial welcome and directory selection screen"""
+def _build_app():
+    """Import the TUI stack and build the wizard application class.
 
-    BINDINGS = [("q", "quit", "Quit")]
+    Textual and Rich are imported lazily here so that importing this module
+    for the ConfigWizard core (tests, headless scripts) does not pull in the
+    full TUI dependency tree.
+    """
+    from textual import work
+    from textual.app import ComposeResult, App
+    from textual.widgets import Header, Footer, Static, Button, Input, Label, RichLog
+    from textual.containers import Container, Vertical, Horizontal
+    from textual.screen import Screen
+    from textual.binding import Binding
+    from rich.text import Text
+    from rich.table import Table
+    from rich import box
 
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Container(
-            Static(
-                Text.from_markup(
-                    "[bold cyan]ICC Profile Organizer - Configuration Wizard[/]\n\n"
-                    "This wizard will help you create a config.yaml file to organize your ICC profiles.\n\n"
-                    "[bold]Features:[/]\n"
-                    "• Automatically scan and detect your profiles\n"
-                    "• Fix undetected files with smart suggestions\n"
-                    "• Create printer and brand mappings without repetition\n"
-                    "• Test patterns before saving\n"
-                )
-            ),
-            Button("Start Setup", id="start-setup", variant="primary"),
-            Button("Quit", id="quit-btn"),
-            id="welcome-container",
-        )
-        yield Footer()
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button press events"""
-        if event.button.id == "start-setup":
-            self.app.push_screen(ScanScreen())
-        elif event.button.id == "quit-btn":
-            self.app.exit()
-
-
-class ScanScreen(Screen):
-    """Scan profiles and show detection status"""
-
-    BINDINGS = [
-        ("q", "quit", "Quit"),
-        Binding("ctrl+c", "quit", "Cancel", show=False),
-    ]
-
-    def __init__(self):
-        super().__init__()
-        self.wizard = None
-        self.scan_complete = False
-
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Container(
-            Static("Select profiles directory to scan:"),
-            Input(
-                value=str(Path.cwd()),
-                id="profile_dir_input",
-            ),
-            Horizontal(
-                Button("Scan Directory", id="scan-btn", variant="primary"),
-                Button("Back", id="back-btn"),
-            ),
-            RichLog(id="scan-results"),
-            Horizontal(
-                Button("Fix Undetected Files", id="fix-btn", variant="primary", disabled=True),
-                Button("Done", id="done-btn", disabled=True),
-                id="action-buttons",
-            ),
-            id="scan-options",
-        )
-        yield Footer()
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button press events"""
-        if event.button.id == "scan-btn":
-            self._action_scan()
-        elif event.button.id == "back-btn":
-            self.app.pop_screen()
-        elif event.button.id == "fix-btn":
-            if self.wizard:
-                # Push screen for both undetected files (fix mode) and detected files (review mode)
-                self.app.push_screen(FixUndetectedScreen(self.wizard))
-        elif event.button.id == "done-btn":
-            self.app.pop_screen()
-
-    def _action_scan(self) -> None:
-        """Scan the selected directory"""
-        input_widget = self.query_one("#profile_dir_input", Input)
-        dir_path = Path(input_widget.value).expanduser()
-
-        if not dir_path.exists():
-            self.query_one("#scan-results", RichLog).write(
-                Text("❌ Directory does not exist!", style="red")
+    class WelcomeScreen(Screen):
+        """Initial welcome and directory selection screen"""
+
+        BINDINGS = [("q", "quit", "Quit")]
+
+        def compose(self) -> ComposeResult:
+            yield Header()
+            yield Container(
+                Static(
+                    Text.from_markup(
+                        "[bold cyan]ICC Profile Organizer - Configuration Wizard[/]\n\n"
+                        "This wizard will help you create a config.yaml file to organize your ICC profiles.\n\n"
+                        "[bold]Features:[/]\n"
+                        "• Automatically scan and detect your profiles\n"
+                        "• Fix undetected files with smart suggestions\n"
+                        "• Create printer and brand mappings without repetition\n"
+                        "• Test patterns before saving\n"
+                    )
+                ),
+                Button("Start Setup", id="start-setup", variant="primary"),
+                Button("Quit", id="quit-btn"),
+                id="welcome-container",
             )
-            return
+            yield Footer()
+
+        def on_button_pressed(self, event: Button.Pressed) -> None:
+            """Handle button press events"""
+            if event.button.id == "start-setup":
+                self.app.push_screen(ScanScreen())
+            elif event.button.id == "quit-btn":
+                self.app.exit()
+
+
+    class ScanScreen(Screen):
+        """Scan profiles and show detection status"""
+
+        BINDINGS = [
+            ("q", "quit", "Quit"),
+            Binding("ctrl+c", "quit", "Cancel", show=False),
+        ]
+
+        def __init__(self):
+            super().__init__()
+            self.wizard = None
+            self.scan_complete = False
+
+        def compose(self) -> ComposeResult:
+            yield Header()
+            yield Container(
+                Static("Select profiles directory to scan:"),
+                Input(
+                    value=str(Path.cwd()),
+                    id="profile_dir_input",
+                ),
+                Horizontal(
+                    Button("Scan Directory", id="scan-btn", variant="primary"),
+                    Button("Back", id="back-btn"),
+                ),
+                RichLog(id="scan-results"),
+                Horizontal(
+                    Button("Fix Undetected Files", id="fix-btn", variant="primary", disabled=True),
+                    Button("Done", id="done-btn", disabled=True),
+                    id="action-buttons",
+                ),
+                id="scan-options",
+            )
+            yield Footer()
+
+        def on_mount(self) -> None:
+            """Resolve widget handles once; query_one walks the DOM each call"""
+            self._dir_input = self.query_one("#profile_dir_input", Input)
+            self._results_log = self.query_one("#scan-results", RichLog)
+            self._fix_btn = self.query_one("#fix-btn", Button)
+            self._done_btn = self.query_one("#done-btn", Button)
+
+        def on_button_pressed(self, event: Button.Pressed) -> None:
+            """Handle button press events"""
+            if event.button.id == "scan-btn":
+                self._action_scan()
+            elif event.button.id == "back-btn":
+                self.app.pop_screen()
+            elif event.button.id == "fix-btn":
+                if self.wizard:
+                    # Push screen for both undetected files (fix mode) and detected files (review mode)
+                    self.app.push_screen(FixUndetectedScreen(self.wizard))
+            elif event.button.id == "done-btn":
+                self.app.pop_screen()
+
+        def _action_scan(self) -> None:
+            """Validate the input and kick off the scan in a worker thread"""
+            dir_path = Path(self._dir_input.value).expanduser()
+
+            if not dir_path.exists():
+                self._results_log.write(
+                    Text("❌ Directory does not exist!", style="red")
+                )
+                return
+
+            # Reuse the wizard when re-scanning the same directory so its
+            # match/analyze/scan caches survive the fix-undetected loop;
+            # cached classifications are keyed by config hash and stay valid
+            if self.wizard is None or self.wizard.profiles_dir != dir_path:
+                self.wizard = ConfigWizard(dir_path, config_manager=self.app.config_manager)
+
+            self._results_log.clear()
+            self._results_log.write(Text(f"\n⏳ Scanning {dir_path} ...", style="dim"))
+            self._run_scan(dir_path)
 
-        # Create wizard and scan
-        self.wizard = ConfigWizard(dir_path)
-        self.wizard.scan_profiles()
+        @work(thread=True, exclusive=True)
+        def _run_scan(self, dir_path: Path) -> None:
+            """Walk and classify off the event loop so the UI stays live.
 
-        detected, total, percentage = self.wizard.get_detection_rate()
+            exclusive=True cancels a still-running scan if the user clicks
+            Scan again; results are marshalled back with call_from_thread.
+            """
+            self.wizard.scan_profiles()
+            self.app.call_from_thread(self._show_scan_results, dir_path)
 
-        results_log = self.query_one("#scan-results", RichLog)
-        results_log.clear()
+        def _show_scan_results(self, dir_path: Path) -> None:
+            """Render the completed scan's results (runs on the UI thread)"""
+            detected, total, percentage = self.wizard.get_detection_rate()
 
-        # Show results
-        results_log.write(Text(f"\n📁 Scanned: {dir_path}\n", style="bold cyan"))
+            results_log = self._results_log
+            results_log.clear()
 
-        summary_table = Table(title="Detection Summary", box=box.ROUNDED)
-        summary_table.add_column("Status", style="cyan")
-        summary_table.add_column("Count", style="yellow")
-        summary_table.add_row("✓ Detected", str(detected))
-        summary_table.add_row("✗ Undetected", str(total - detected))
-        summary_table.add_row("Total", str(total))
+            # Show results
+            results_log.write(Text(f"\n📁 Scanned: {dir_path}\n", style="bold cyan"))
 
-        results_log.write(summary_table)
-        results_log.write(
-            Text(
+            summary_table = Table(title="Detection Summary", box=box.ROUNDED)
+            summary_table.add_column("Status", style="cyan")
+            summary_table.add_column("Count", style="yellow")
+            summary_table.add_row("✓ Detected", str(detected))
+            summary_table.add_row("✗ Undetected", str(total - detected))
+            summary_table.add_row("Total", str(total))
+
+            results_log.write(summary_table)
+
+            # Batch the remaining text into one Text so the log renders once
+            body = Text(
                 f"\n📊 Detection Rate: {percentage:.1f}%\n",
                 style="bold green" if percentage >= 90 else "yellow",
             )
-        )
 
-        # Enable/disable action buttons
-        fix_btn = self.query_one("#fix-btn", Button)
-        done_btn = self.query_one("#done-btn", Button)
+            # Enable/disable action buttons
+            fix_btn = self._fix_btn
+            done_btn = self._done_btn
 
-        if total == 0:
-            results_log.write(Text("\n✓ No profile files found in this directory.\n", style="yellow"))
-            done_btn.disabled = False
-        elif self.wizard.undetected_files:
-            results_log.write(
-                Text(
+            if total == 0:
+                body.append("\n✓ No profile files found in this directory.\n", style="yellow")
+                done_btn.disabled = False
+            elif self.wizard.undetected_files:
+                body.append(
                     f"\n⚠️  {len(self.wizard.undetected_files)} files need manual mapping\n",
                     style="yellow",
                 )
-            )
 
-            # Show first few undetected
-            results_log.write(Text("Undetected files:\n", style="bold"))
-            for i, pf in enumerate(self.wizard.undetected_files[:10]):
-                results_log.write(Text(f"  • {pf.filename}\n", style="dim"))
+                # Show first few undetected
+                body.append("Undetected files:\n", style="bold")
+                for pf in self.wizard.undetected_files[:10]:
+                    body.append(_BULLET + pf.filename + "\n", style="dim")
 
-            if len(self.wizard.undetected_files) > 10:
-                results_log.write(
-                    Text(
+                if len(self.wizard.undetected_files) > 10:
+                    body.append(
                         f"  ... and {len(self.wizard.undetected_files) - 10} more\n",
                         style="dim",
                     )
-                )
 
-            results_log.write(Text("\n"))
-            results_log.write(
-                Text("Ready to fix undetected files? Click 'Fix Undetected Files' below.\n", style="bold")
-            )
-            fix_btn.disabled = False
-        else:
-            results_log.write(Text("\n✓ All files detected!\n", style="green"))
-            results_log.write(Text("You can review the detections and adjust any mappings if needed.\n", style="dim"))
-            fix_btn.disabled = False  # Enable to allow review even if all detected
-            fix_btn.label = "Review Detections"
-
-
-class FixUndetectedScreen(Screen):
-    """Interactive screen to fix undetected files by groups"""
-
-    BINDINGS = [
-        ("q", "quit", "Quit"),
-    ]
-
-    def __init__(self, wizard: ConfigWizard):
-        super().__init__()
-        self.wizard = wizard
-        self.current_index = 0
-        # If there are undetected files, group those; otherwise group detected files for review
-        if wizard.undetected_files:
-            self.file_groups = wizard.group_undetected_files()
-        else:
-            self.file_groups = wizard.group_detected_files()
-        self.confirmed_groups: Dict[int, Tuple[str, str]] = {}  # group_index -> (printer, brand)
-        self.pattern_replacements: Dict[int, Tuple[str, str, str, str]] = {}  # group_index -> (printer_orig, printer_repl, brand_orig, brand_repl)
+                body.append("\n")
+                body.append("Ready to fix undetected files? Click 'Fix Undetected Files' below.\n", style="bold")
+                fix_btn.disabled = False
+            else:
+                body.append("\n✓ All files detected!\n", style="green")
+                body.append("You can review the detections and adjust any mappings if needed.\n", style="dim")
+                fix_btn.disabled = False  # Enable to allow review even if all detected
+                fix_btn.label = "Review Detections"
 
-    def compose(self) -> ComposeResult:
-        yield Header()
+            results_log.write(body)
 
-        if not self.file_groups:
-            yield Container(
-                Static(Text("✓ No files to review!", style="green")),
-                Button("Done", id="done-btn"),
-            )
-            return
 
-        current_group = self.file_groups[self.current_index]
-        is_review_mode = self.wizard.undetected_files == []  # Review mode if no undetected files
+    class FixUndetectedScreen(Screen):
+        """Interactive screen to fix undetected files by groups"""
 
-        # Determine button text based on mode
-        action_button_text = "Looks Good, Next" if is_review_mode else "Confirm & Next"
-        hint_text = "\n💡 These detections look correct. Click 'Looks Good, Next' to continue." if is_review_mode else "\n💡 Paper types will be auto-extracted from each filename"
+        BINDINGS = [
+            ("q", "quit", "Quit"),
+        ]
 
-        yield Container(
-            Static(f"Group {self.current_index + 1} of {len(self.file_groups)}", id="group-counter"),
-            Vertical(
-                Static(Text(f"Pattern: {current_group.pattern_similarity}", style="bold yellow"), id="pattern-display"),
-                Static(Text(f"\n{len(current_group.files)} files match this pattern:", style="cyan"), id="file-count"),
-                RichLog(id="example-files", max_lines=5),
-                Static("", id="detection-display"),
-                Vertical(
-                    Label("Printer Model:"),
-                    Input(id="printer-input"),
-                    Label("Paper Brand:"),
-                    Input(id="brand-input"),
-                    id="mapping-form",
-                ),
-                Static(Text("\n💡 Optional: Add pattern replacements to help detect similar files", style="bold yellow"), id="pattern-hint"),
+        def __init__(self, wizard: ConfigWizard):
+            super().__init__()
+            self.wizard = wizard
+            self.current_index = 0
+            # If there are undetected files, group those; otherwise group detected files for review
+            if wizard.undetected_files:
+                self.file_groups = wizard.group_undetected_files()
+            else:
+                self.file_groups = wizard.group_detected_files()
+            self.confirmed_groups: Dict[int, Tuple[str, str]] = {}  # group_index -> (printer, brand)
+            self.pattern_replacements: Dict[int, Tuple[str, str, str, str]] = {}  # group_index -> (printer_orig, printer_repl, brand_orig, brand_repl)
+            # Review mode (no undetected files) never changes for a screen's lifetime
+            self.is_review_mode = not wizard.undetected_files
+
+        def compose(self) -> ComposeResult:
+            yield Header()
+
+            if not self.file_groups:
+                yield Container(
+                    Static(Text("✓ No files to review!", style="green")),
+                    Button("Done", id="done-btn"),
+                )
+                return
+
+            current_group = self.file_groups[self.current_index]
+
+            # Determine button text based on mode
+            action_button_text = "Looks Good, Next" if self.is_review_mode else "Confirm & Next"
+            hint_text = "\n💡 These detections look correct. Click 'Looks Good, Next' to continue." if self.is_review_mode else "\n💡 Paper types will be auto-extracted from each filename"
+
+            yield Container(
+                Static(f"Group {self.current_index + 1} of {len(self.file_groups)}", id="group-counter"),
                 Vertical(
-                    Static(Text("Printer Pattern (optional):", style="bold")),
-                    Horizontal(
-                        Input(id="printer-pattern-orig", placeholder="Text in filename (e.g., PRO-100)"),
-                        Static("→", id="arrow1"),
-                        Input(id="printer-pattern-repl", placeholder="Replace with (e.g., Canon Pixma PRO-100)"),
+                    Static(Text(f"Pattern: {current_group.pattern_similarity}", style="bold yellow"), id="pattern-display"),
+                    Static(Text(f"\n{len(current_group.files)} files match this pattern:", style="cyan"), id="file-count"),
+                    RichLog(id="example-files", max_lines=5),
+                    Static("", id="detection-display"),
+                    Vertical(
+                        Label("Printer Model:"),
+                        Input(id="printer-input"),
+                        Label("Paper Brand:"),
+                        Input(id="brand-input"),
+                        id="mapping-form",
                     ),
-                    Static(Text("Brand Pattern (optional):", style="bold")),
+                    Static(Text("\n💡 Optional: Add pattern replacements to help detect similar files", style="bold yellow"), id="pattern-hint"),
+                    Vertical(
+                        Static(Text("Printer Pattern (optional):", style="bold")),
+                        Horizontal(
+                            Input(id="printer-pattern-orig", placeholder="Text in filename (e.g., PRO-100)"),
+                            Static("→", id="arrow1"),
+                            Input(id="printer-pattern-repl", placeholder="Replace with (e.g., Canon Pixma PRO-100)"),
+                        ),
+                        Static(Text("Brand Pattern (optional):", style="bold")),
+                        Horizontal(
+                            Input(id="brand-pattern-orig", placeholder="Text in filename (e.g., MOAB)"),
+                            Static("→", id="arrow2"),
+                            Input(id="brand-pattern-repl", placeholder="Replace with (e.g., MOAB)"),
+                        ),
+                        id="pattern-form",
+                    ),
+                    Static(Text(hint_text, style="dim italic"), id="hint"),
                     Horizontal(
-                        Input(id="brand-pattern-orig", placeholder="Text in filename (e.g., MOAB)"),
-                        Static("→", id="arrow2"),
-                        Input(id="brand-pattern-repl", placeholder="Replace with (e.g., MOAB)"),
+                        Button("Previous", id="prev-btn"),
+                        Button(action_button_text, id="save-next-btn", variant="primary"),
+                        Button("Skip Group", id="skip-btn"),
+                        Button("Done", id="done-btn"),
                     ),
-                    id="pattern-form",
+                    id="group-editor",
                 ),
-                Static(Text(hint_text, style="dim italic"), id="hint"),
-                Horizontal(
-                    Button("Previous", id="prev-btn"),
-                    Button(action_button_text, id="save-next-btn", variant="primary"),
-                    Button("Skip Group", id="skip-btn"),
-                    Button("Done", id="done-btn"),
-                ),
-                id="group-editor",
-            ),
-            id="main-container",
-        )
-        yield Footer()
-
-    def _update_group_display(self) -> None:
-        """Update the display for the current group"""
-        current_group = self.file_groups[self.current_index]
-
-        # Show example files
-        examples_log = self.query_one("#example-files", RichLog)
-        examples_log.clear()
-        for i, file in enumerate(current_group.files[:5]):
-            examples_log.write(Text(f"  • {file.filename}", style="dim"))
-        if len(current_group.files) > 5:
-            examples_log.write(Text(f"  ... and {len(current_group.files) - 5} more", style="dim italic"))
-
-        # Show detection status
-        detection_text = Text()
-
-        # Check if we have valid detections (not "Unknown")
-        has_valid_printer = current_group.detected_printer and current_group.detected_printer != "Unknown"
-        has_valid_brand = current_group.detected_brand and current_group.detected_brand != "Unknown"
-
-        if has_valid_printer or has_valid_brand:
-            detection_text.append("\n✓ Auto-detected:\n", style="bold green")
-            if has_valid_printer:
-                detection_text.append(f"  Printer: {current_group.detected_printer}\n", style="cyan")
-            if has_valid_brand:
-                detection_text.append(f"  Brand: {current_group.detected_brand}\n", style="cyan")
-
-            missing = []
-            if not has_valid_printer:
-                missing.append("printer")
-            if not has_valid_brand:
-                missing.append("brand")
-
-            if missing:
-                detection_text.append(f"\n⚠ Please specify: {', '.join(missing)}\n", style="yellow")
-        else:
-            detection_text.append("\n⚠ Could not auto-detect printer or brand\n", style="yellow")
-            detection_text.append("Please fill in both fields and add pattern replacements if needed\n", style="dim")
-
-        self.query_one("#detection-display", Static).update(detection_text)
-
-    def on_mount(self) -> None:
-        """Initialize the form with auto-detected values"""
-        self._update_group_display()
-
-        current_group = self.file_groups[self.current_index]
-        is_review_mode = self.wizard.undetected_files == []
-
-        # Check if user previously confirmed this group
-        if self.current_index in self.confirmed_groups:
-            printer, brand = self.confirmed_groups[self.current_index]
-            self.query_one("#printer-input", Input).value = printer
-            self.query_one("#brand-input", Input).value = brand
-        else:
-            # Auto-populate with detected values
-            if current_group.detected_printer:
-                self.query_one("#printer-input", Input).value = current_group.detected_printer
-            if current_group.detected_brand:
-                self.query_one("#brand-input", Input).value = current_group.detected_brand
-
-        # Load pattern replacements if previously set
-        if self.current_index in self.pattern_replacements:
-            printer_orig, printer_repl, brand_orig, brand_repl = self.pattern_replacements[self.current_index]
-            self.query_one("#printer-pattern-orig", Input).value = printer_orig
-            self.query_one("#printer-pattern-repl", Input).value = printer_repl
-            self.query_one("#brand-pattern-orig", Input).value = brand_orig
-            self.query_one("#brand-pattern-repl", Input).value = brand_repl
-
-        # Hide pattern form in review mode
-        pattern_form = self.query_one("#pattern-form", Vertical)
-        pattern_hint = self.query_one("#pattern-hint", Static)
-        if is_review_mode:
-            pattern_form.display = False
-            pattern_hint.display = False
-        else:
-            pattern_form.display = True
-            pattern_hint.display = True
-
-    def _save_current_group(self) -> bool:
-        """Save the current group mapping"""
-        printer = self.query_one("#printer-input", Input).value.strip()
-        brand = self.query_one("#brand-input", Input).value.strip()
-
-        if not all([printer, brand]):
-            self.notify("Please fill in printer and brand", severity="error", timeout=3)
-            return False
-
-        current_group = self.file_groups[self.current_index]
-
-        # Store the confirmation
-        self.confirmed_groups[self.current_index] = (printer, brand)
-
-        # Get pattern replacements (optional)
-        printer_pattern_orig = self.query_one("#printer-pattern-orig", Input).value.strip()
-        printer_pattern_repl = self.query_one("#printer-pattern-repl", Input).value.strip()
-        brand_pattern_orig = self.query_one("#brand-pattern-orig", Input).value.strip()
-        brand_pattern_repl = self.query_one("#brand-pattern-repl", Input).value.strip()
-
-        # Store pattern replacements for this group
-        self.pattern_replacements[self.current_index] = (
-            printer_pattern_orig,
-            printer_pattern_repl,
-            brand_pattern_orig,
-            brand_pattern_repl,
-        )
-
-        # Add pattern replacements to wizard if both original and replacement are provided
-        # Collect example filenames from this group
-        example_filenames = [pf.filename for pf in current_group.files[:5]]  # Use first 5 as examples
-        
-        if printer_pattern_orig and printer_pattern_repl:
-            replacement = PatternReplacement(
-                original_text=printer_pattern_orig,
-                replacement=printer_pattern_repl,
-                replacement_type="printer",
-                example_filenames=example_filenames,
+                id="main-container",
             )
-            self.wizard.add_pattern_replacement(replacement)
-
-        if brand_pattern_orig and brand_pattern_repl:
-            replacement = PatternReplacement(
-                original_text=brand_pattern_orig,
-                replacement=brand_pattern_repl,
-                replacement_type="brand",
-                example_filenames=example_filenames,
+            yield Footer()
+
+        def _set_static(self, name: str, widget, key, content) -> None:
+            """Update a Static only when its content actually changed.
+
+            Identical updates still schedule a Textual re-render; comparing
+            against the last-rendered key short-circuits that for the labels
+            on the group navigation hot path.
+            """
+            if self._last_static.get(name) == key:
+                return
+            self._last_static[name] = key
+            widget.update(content)
+
+        def _update_group_display(self) -> None:
+            """Update the display for the current group"""
+            current_group = self.file_groups[self.current_index]
+
+            # Show example files
+            examples_log = self._examples_log
+            examples_log.clear()
+            examples = Text()
+            for file in current_group.files[:5]:
+                examples.append(_BULLET + file.filename + "\n", style="dim")
+            if len(current_group.files) > 5:
+                examples.append(f"  ... and {len(current_group.files) - 5} more", style="dim italic")
+            examples_log.write(examples)
+
+            # Show detection status
+            detection_text = Text()
+
+            # Check if we have valid detections (not "Unknown")
+            has_valid_printer = current_group.detected_printer and current_group.detected_printer != "Unknown"
+            has_valid_brand = current_group.detected_brand and current_group.detected_brand != "Unknown"
+
+            if has_valid_printer or has_valid_brand:
+                detection_text.append("\n✓ Auto-detected:\n", style="bold green")
+                if has_valid_printer:
+                    detection_text.append(f"  Printer: {current_group.detected_printer}\n", style="cyan")
+                if has_valid_brand:
+                    detection_text.append(f"  Brand: {current_group.detected_brand}\n", style="cyan")
+
+                missing = []
+                if not has_valid_printer:
+                    missing.append("printer")
+                if not has_valid_brand:
+                    missing.append("brand")
+
+                if missing:
+                    detection_text.append(f"\n⚠ Please specify: {', '.join(missing)}\n", style="yellow")
+            else:
+                detection_text.append("\n⚠ Could not auto-detect printer or brand\n", style="yellow")
+                detection_text.append("Please fill in both fields and add pattern replacements if needed\n", style="dim")
+
+            self._set_static(
+                "detection",
+                self._detection_display,
+                (current_group.detected_printer, current_group.detected_brand),
+                detection_text,
             )
-            self.wizard.add_pattern_replacement(replacement)
 
-        # Generate filename pattern if we have both printer and brand replacements
-        if (printer_pattern_orig and printer_pattern_repl and 
-            brand_pattern_orig and brand_pattern_repl and example_filenames):
-            pattern = self.wizard._analyze_filename_structure(
-                example_filenames[0],
+        def on_mount(self) -> None:
+            """Initialize the form with auto-detected values"""
+            if not self.file_groups:
+                return
+
+            # Resolve widget handles once; query_one walks the DOM each call
+            self._printer_input = self.query_one("#printer-input", Input)
+            self._brand_input = self.query_one("#brand-input", Input)
+            self._printer_pattern_orig = self.query_one("#printer-pattern-orig", Input)
+            self._printer_pattern_repl = self.query_one("#printer-pattern-repl", Input)
+            self._brand_pattern_orig = self.query_one("#brand-pattern-orig", Input)
+            self._brand_pattern_repl = self.query_one("#brand-pattern-repl", Input)
+            self._group_counter = self.query_one("#group-counter", Static)
+            self._pattern_display = self.query_one("#pattern-display", Static)
+            self._file_count = self.query_one("#file-count", Static)
+            self._detection_display = self.query_one("#detection-display", Static)
+            self._examples_log = self.query_one("#example-files", RichLog)
+            self._pattern_form = self.query_one("#pattern-form", Vertical)
+            self._pattern_hint = self.query_one("#pattern-hint", Static)
+            # Last-rendered content per label, used to skip no-op updates
+            self._last_static: Dict[str, object] = {}
+
+            self._update_group_display()
+
+            current_group = self.file_groups[self.current_index]
+
+            # Check if user previously confirmed this group
+            if self.current_index in self.confirmed_groups:
+                printer, brand = self.confirmed_groups[self.current_index]
+                self._printer_input.value = printer
+                self._brand_input.value = brand
+            else:
+                # Auto-populate with detected values
+                if current_group.detected_printer:
+                    self._printer_input.value = current_group.detected_printer
+                if current_group.detected_brand:
+                    self._brand_input.value = current_group.detected_brand
+
+            # Load pattern replacements if previously set
+            if self.current_index in self.pattern_replacements:
+                printer_orig, printer_repl, brand_orig, brand_repl = self.pattern_replacements[self.current_index]
+                self._printer_pattern_orig.value = printer_orig
+                self._printer_pattern_repl.value = printer_repl
+                self._brand_pattern_orig.value = brand_orig
+                self._brand_pattern_repl.value = brand_repl
+
+            # Hide pattern form in review mode
+            self._pattern_form.display = not self.is_review_mode
+            self._pattern_hint.display = not self.is_review_mode
+
+        def _save_current_group(self) -> bool:
+            """Save the current group mapping"""
+            printer = self._printer_input.value.strip()
+            brand = self._brand_input.value.strip()
+
+            if not all([printer, brand]):
+                self.notify("Please fill in printer and brand", severity="error", timeout=3)
+                return False
+
+            current_group = self.file_groups[self.current_index]
+
+            # Store the confirmation
+            self.confirmed_groups[self.current_index] = (printer, brand)
+
+            # Get pattern replacements (optional)
+            printer_pattern_orig = self._printer_pattern_orig.value.strip()
+            printer_pattern_repl = self._printer_pattern_repl.value.strip()
+            brand_pattern_orig = self._brand_pattern_orig.value.strip()
+            brand_pattern_repl = self._brand_pattern_repl.value.strip()
+
+            # Store pattern replacements for this group
+            self.pattern_replacements[self.current_index] = (
                 printer_pattern_orig,
-                brand_pattern_orig,
                 printer_pattern_repl,
+                brand_pattern_orig,
                 brand_pattern_repl,
             )
-            if pattern:
-                self.wizard.add_generated_pattern(pattern)
 
-        # Create mappings for all files in this group
-        for profile_file in current_group.files:
-            # Try to extract paper type from filename using ConfigManager
-            detected = self.wizard._analyze_file(profile_file.filename)
-            paper_type = detected.get("paper_type")
+            # Add pattern replacements to wizard if both original and replacement are provided
+            # Collect example filenames from this group
+            example_filenames = [pf.filename for pf in current_group.files[:5]]  # Use first 5 as examples
+        
+            if printer_pattern_orig and printer_pattern_repl:
+                replacement = PatternReplacement(
+                    original_text=printer_pattern_orig,
+                    replacement=printer_pattern_repl,
+                    replacement_type="printer",
+                    example_filenames=example_filenames,
+                )
+                self.wizard.add_pattern_replacement(replacement)
+
+            if brand_pattern_orig and brand_pattern_repl:
+                replacement = PatternReplacement(
+                    original_text=brand_pattern_orig,
+                    replacement=brand_pattern_repl,
+                    replacement_type="brand",
+                    example_filenames=example_filenames,
+                )
+                self.wizard.add_pattern_replacement(replacement)
+
+            # Generate filename pattern if we have both printer and brand replacements
+            if (printer_pattern_orig and printer_pattern_repl and 
+                brand_pattern_orig and brand_pattern_repl and example_filenames):
+                pattern = self.wizard._analyze_filename_structure(
+                    example_filenames[0],
+                    printer_pattern_orig,
+                    brand_pattern_orig,
+                    printer_pattern_repl,
+                    brand_pattern_repl,
+                )
+                if pattern:
+                    self.wizard.add_generated_pattern(pattern)
+
+            # Create mappings for all files in this group. Paper types were
+            # resolved during grouping, so no per-file re-analysis is needed.
+            self.wizard.add_user_mappings([
+                UserMapping(
+                    filename=profile_file.filename,
+                    printer=printer,
+                    brand=brand,
+                    paper_type=paper_type,
+                    ext=os.path.splitext(profile_file.filename)[1].lstrip('.'),
+                )
+                for profile_file, paper_type in zip(current_group.files, current_group.paper_types)
+            ])
 
-            # If no paper type detected, use formatted filename stem as fallback
-            if not paper_type:
-                raw_name = Path(profile_file.filename).stem
-                # Use lib function to format the paper type properly
-                paper_type = format_paper_type(raw_name)
+            return True
 
-            mapping = UserMapping(
-                filename=profile_file.filename,
-                printer=printer,
-                brand=brand,
-                paper_type=paper_type,
-            )
-            self.wizard.add_user_mapping(mapping)
+        def _move_to_group(self, index: int) -> None:
+            """Move to a specific group index"""
+            if not (0 <= index < len(self.file_groups)):
+                return
 
-        return True
+            self.current_index = index
 
-    def _move_to_group(self, index: int) -> None:
-        """Move to a specific group index"""
-        if not (0 <= index < len(self.file_groups)):
-            return
+            # Update the display for the new group
+            current_group = self.file_groups[self.current_index]
 
-        self.current_index = index
+            # Update counter
+            counter = f"Group {self.current_index + 1} of {len(self.file_groups)}"
+            self._set_static("counter", self._group_counter, counter, counter)
 
-        # Update the display for the new group
-        current_group = self.file_groups[self.current_index]
+            # Update pattern display
+            self._set_static(
+                "pattern",
+                self._pattern_display,
+                current_group.pattern_similarity,
+                Text(f"Pattern: {current_group.pattern_similarity}", style="bold yellow"),
+            )
 
-        # Update counter
-        self.query_one("#group-counter", Static).update(f"Group {self.current_index + 1} of {len(self.file_groups)}")
+            # Update file count
+            file_count = len(current_group.files)
+            self._set_static(
+                "file-count",
+                self._file_count,
+                file_count,
+                Text(f"\n{file_count} files match this pattern:", style="cyan"),
+            )
 
-        # Update pattern display
-        self.query_one("#pattern-display", Static).update(Text(f"Pattern: {current_group.pattern_similarity}", style="bold yellow"))
+            # Update the group display (examples and detection status)
+            self._update_group_display()
 
-        # Update file count
-        self.query_one("#file-count", Static).update(Text(f"\n{len(current_group.files)} files match this pattern:", style="cyan"))
+            # Update input fields
+            if self.current_index in self.confirmed_groups:
+                printer, brand = self.confirmed_groups[self.current_index]
+                self._printer_input.value = printer
+                self._brand_input.value = brand
+            else:
+                # Auto-populate with detected values
+                self._printer_input.value = current_group.detected_printer or ""
+                self._brand_input.value = current_group.detected_brand or ""
 
-        # Update the group display (examples and detection status)
-        self._update_group_display()
+            # Update pattern replacement fields
+            if self.current_index in self.pattern_replacements:
+                printer_orig, printer_repl, brand_orig, brand_repl = self.pattern_replacements[self.current_index]
+            else:
+                printer_orig = printer_repl = brand_orig = brand_repl = ""
+            self._printer_pattern_orig.value = printer_orig
+            self._printer_pattern_repl.value = printer_repl
+            self._brand_pattern_orig.value = brand_orig
+            self._brand_pattern_repl.value = brand_repl
+
+            # Show/hide pattern form based on mode
+            self._pattern_form.display = not self.is_review_mode
+            self._pattern_hint.display = not self.is_review_mode
+
+        def on_button_pressed(self, event: Button.Pressed) -> None:
+            """Handle button press events"""
+            if event.button.id == "save-next-btn":
+                self._on_save_next()
+            elif event.button.id == "prev-btn":
+                if self.current_index > 0:
+                    self._move_to_group(self.current_index - 1)
+            elif event.button.id == "skip-btn":
+                # Skip this group and move to next
+                if self.current_index + 1 < len(self.file_groups):
+                    self._move_to_group(self.current_index + 1)
+                else:
+                    self.app.pop_screen()
+                    self.app.push_screen(ReviewScreen(self.wizard))
+            elif event.button.id == "cancel-btn":
+                self.app.pop_screen()
+            elif event.button.id == "done-btn":
+                self.app.pop_screen()
+
+        def _on_save_next(self) -> None:
+            """Save current group and move to next"""
+            if not self._save_current_group():
+                return
 
-        # Update input fields
-        if self.current_index in self.confirmed_groups:
-            printer, brand = self.confirmed_groups[self.current_index]
-            self.query_one("#printer-input", Input).value = printer
-            self.query_one("#brand-input", Input).value = brand
-        else:
-            # Auto-populate with detected values
-            self.query_one("#printer-input", Input).value = current_group.detected_printer or ""
-            self.query_one("#brand-input", Input).value = current_group.detected_brand or ""
-
-        # Update pattern replacement fields
-        if self.current_index in self.pattern_replacements:
-            printer_orig, printer_repl, brand_orig, brand_repl = self.pattern_replacements[self.current_index]
-            self.query_one("#printer-pattern-orig", Input).value = printer_orig
-            self.query_one("#printer-pattern-repl", Input).value = printer_repl
-            self.query_one("#brand-pattern-orig", Input).value = brand_orig
-            self.query_one("#brand-pattern-repl", Input).value = brand_repl
-        else:
-            self.query_one("#printer-pattern-orig", Input).value = ""
-            self.query_one("#printer-pattern-repl", Input).value = ""
-            self.query_one("#brand-pattern-orig", Input).value = ""
-            self.query_one("#brand-pattern-repl", Input).value = ""
-
-        # Show/hide pattern form based on mode
-        is_review_mode = self.wizard.undetected_files == []
-        pattern_form = self.query_one("#pattern-form", Vertical)
-        pattern_hint = self.query_one("#pattern-hint", Static)
-        if is_review_mode:
-            pattern_form.display = False
-            pattern_hint.display = False
-        else:
-            pattern_form.display = True
-            pattern_hint.display = True
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button press events"""
-        if event.button.id == "save-next-btn":
-            self._on_save_next()
-        elif event.button.id == "prev-btn":
-            if self.current_index > 0:
-                self._move_to_group(self.current_index - 1)
-        elif event.button.id == "skip-btn":
-            # Skip this group and move to next
             if self.current_index + 1 < len(self.file_groups):
                 self._move_to_group(self.current_index + 1)
             else:
+                # All done
                 self.app.pop_screen()
                 self.app.push_screen(ReviewScreen(self.wizard))
-        elif event.button.id == "cancel-btn":
-            self.app.pop_screen()
-        elif event.button.id == "done-btn":
-            self.app.pop_screen()
-
-    def _on_save_next(self) -> None:
-        """Save current group and move to next"""
-        if not self._save_current_group():
-            return
 
-        if self.current_index + 1 < len(self.file_groups):
-            self._move_to_group(self.current_index + 1)
-        else:
-            # All done
-            self.app.pop_screen()
-            self.app.push_screen(ReviewScreen(self.wizard))
 
+    class ReviewScreen(Screen):
+        """Review mappings before saving"""
 
-class ReviewScreen(Screen):
-    """Review mappings before saving"""
+        BINDINGS = [("q", "quit", "Quit")]
 
-    BINDINGS = [("q", "quit", "Quit")]
+        def __init__(self, wizard: ConfigWizard):
+            super().__init__()
+            self.wizard = wizard
 
-    def __init__(self, wizard: ConfigWizard):
-        super().__init__()
-        self.wizard = wizard
+        def compose(self) -> ComposeResult:
+            yield Header()
+            yield Container(
+                Static("Review Your Mappings:", id="title"),
+                RichLog(id="review-log"),
+                Horizontal(
+                    Button("Save config.yaml", id="save-btn", variant="primary"),
+                    Button("Edit More", id="edit-more-btn"),
+                    Button("Cancel", id="cancel-btn"),
+                ),
+                id="review-container",
+            )
+            yield Footer()
+
+        def on_mount(self) -> None:
+            """Display the mappings review"""
+            log = self.query_one("#review-log", RichLog)
+
+            if not self.wizard.user_mappings and not self.wizard.pattern_replacements:
+                log.write(Text("No mappings defined yet.", style="yellow"))
+                return
+
+            # Build the whole review into one Text so the log renders once
+            body = Text()
+
+            # Show pattern replacements first
+            if self.wizard.pattern_replacements:
+                body.append("\n🔧 Pattern Replacements:\n", style="bold cyan")
+
+                # Single pass over the replacements instead of two scans
+                printer_replacements = []
+                brand_replacements = []
+                for r in self.wizard.pattern_replacements:
+                    if r.replacement_type == "printer":
+                        printer_replacements.append(r)
+                    elif r.replacement_type == "brand":
+                        brand_replacements.append(r)
+
+                if printer_replacements:
+                    body.append("\n  Printer Patterns:\n", style="bold yellow")
+                    for replacement in printer_replacements:
+                        body.append(f"    {replacement.original_text} → {replacement.replacement}\n", style="dim")
+
+                if brand_replacements:
+                    body.append("\n  Brand Patterns:\n", style="bold yellow")
+                    for replacement in brand_replacements:
+                        body.append(f"    {replacement.original_text} → {replacement.replacement}\n", style="dim")
+
+                body.append("\n")
+
+            if not self.wizard.user_mappings:
+                log.write(body)
+                return
+
+            # Group by printer and brand
+            grouped = defaultdict(list)
+            for mapping in self.wizard.user_mappings:
+                grouped[(mapping.printer, mapping.brand)].append(mapping)
+
+            body.append(f"\n📝 Total File Mappings: {len(self.wizard.user_mappings)}\n", style="bold cyan")
+
+            # Track existing filenames for deduplication
+            existing_names = {}
+
+            for (printer, brand), mappings in sorted(grouped.items()):
+                body.append(f"\n{printer} → {brand}:\n", style="bold")
+                for m in mappings:
+                    # Extension was captured when the mapping was created
+                    ext = m.ext or os.path.splitext(m.filename)[1].lstrip('.')
+
+                    # Generate the new standardized filename using lib function
+                    new_filename = generate_new_filename(m.printer, m.brand, m.paper_type, ext, existing_names)
+
+                    # Show old → new on same line
+                    body.append(_BULLET + m.filename, style="dim")
+                    body.append(" → ", style="yellow")
+                    body.append(f"{new_filename}\n", style="cyan")
+
+            log.write(body)
+
+        def on_button_pressed(self, event: Button.Pressed) -> None:
+            """Handle button press events"""
+            if event.button.id == "save-btn":
+                if self.wizard.save_config():
+                    self.app.notify("✓ config.yaml saved successfully!", timeout=5)
+                    self.app.pop_screen()
+                    self.app.pop_screen()
+                    self.app.push_screen(SuccessScreen(self.wizard))
+                else:
+                    self.app.notify("Error saving config.yaml", severity="error", timeout=5)
+            elif event.button.id == "edit-more-btn":
+                self.app.pop_screen()
+            elif event.button.id == "cancel-btn":
+                self.app.pop_screen()
 
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Container(
-            Static("Review Your Mappings:", id="title"),
-            RichLog(id="review-log"),
-            Horizontal(
-                Button("Save config.yaml", id="save-btn", variant="primary"),
-                Button("Edit More", id="edit-more-btn"),
-                Button("Cancel", id="cancel-btn"),
-            ),
-            id="review-container",
-        )
-        yield Footer()
 
-    def on_mount(self) -> None:
-        """Display the mappings review"""
-        log = self.query_one("#review-log", RichLog)
+    class SuccessScreen(Screen):
+        """Success confirmation screen"""
 
-        if not self.wizard.user_mappings and not self.wizard.pattern_replacements:
-            log.write(Text("No mappings defined yet.", style="yellow"))
-            return
+        BINDINGS = [("q", "quit", "Quit")]
 
-        # Show pattern replacements first
-        if self.wizard.pattern_replacements:
-            log.write(Text("\n🔧 Pattern Replacements:\n", style="bold cyan"))
-            
-            printer_replacements = [r for r in self.wizard.pattern_replacements if r.replacement_type == "printer"]
-            brand_replacements = [r for r in self.wizard.pattern_replacements if r.replacement_type == "brand"]
-            
-            if printer_replacements:
-                log.write(Text("\n  Printer Patterns:\n", style="bold yellow"))
-                for replacement in printer_replacements:
-                    log.write(Text(f"    {replacement.original_text} → {replacement.replacement}\n", style="dim"))
-            
-            if brand_replacements:
-                log.write(Text("\n  Brand Patterns:\n", style="bold yellow"))
-                for replacement in brand_replacements:
-                    log.write(Text(f"    {replacement.original_text} → {replacement.replacement}\n", style="dim"))
-            
-            log.write(Text("\n"))
+        def __init__(self, wizard: ConfigWizard):
+            super().__init__()
+            self.wizard = wizard
 
-        if not self.wizard.user_mappings:
-            return
+        def compose(self) -> ComposeResult:
+            yield Header()
+            yield Container(
+                Static(
+                    Text.from_markup(
+                        "[bold green]✓ Configuration Complete![/]\n\n"
+                        f"Saved {len(self.wizard.user_mappings)} mappings to config.yaml\n\n"
+                        "You can now run:\n"
+                        "  python organize_profiles.py [--execute]\n\n"
+                        "to organize your profiles!"
+                    )
+                ),
+                Button("Done", id="done-btn", variant="primary"),
+                id="success-container",
+            )
+            yield Footer()
+
+        def on_button_pressed(self, event: Button.Pressed) -> None:
+            """Handle button press events"""
+            if event.button.id == "done-btn":
+                self.app.exit()
 
-        # Group by printer and brand
-        grouped = {}
-        for mapping in self.wizard.user_mappings:
-            key = (mapping.printer, mapping.brand)
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(mapping)
-
-        log.write(Text(f"\n📝 Total File Mappings: {len(self.wizard.user_mappings)}\n", style="bold cyan"))
-
-        # Track existing filenames for deduplication
-        existing_names = {}
-
-        for (printer, brand), mappings in sorted(grouped.items()):
-            log.write(Text(f"\n{printer} → {brand}:\n", style="bold"))
-            for m in mappings:
-                # Get file extension
-                ext = Path(m.filename).suffix.lstrip('.')
-
-                # Generate the new standardized filename using lib function
-                new_filename = generate_new_filename(m.printer, m.brand, m.paper_type, ext, existing_names)
-
-                # Show old → new on same line
-                mapping_line = Text()
-                mapping_line.append(f"  • {m.filename}", style="dim")
-                mapping_line.append(" → ", style="yellow")
-                mapping_line.append(f"{new_filename}\n", style="cyan")
-                log.write(mapping_line)
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button press events"""
-        if event.button.id == "save-btn":
-            if self.wizard.save_config():
-                self.app.notify("✓ config.yaml saved successfully!", timeout=5)
-                self.app.pop_screen()
-                self.app.pop_screen()
-                self.app.push_screen(SuccessScreen(self.wizard))
-            else:
-                self.app.notify("Error saving config.yaml", severity="error", timeout=5)
-        elif event.button.id == "edit-more-btn":
-            self.app.pop_screen()
-        elif event.button.id == "cancel-btn":
-            self.app.pop_screen()
-
-
-class SuccessScreen(Screen):
-    """Success confirmation screen"""
-
-    BINDINGS = [("q", "quit", "Quit")]
-
-    def __init__(self, wizard: ConfigWizard):
-        super().__init__()
-        self.wizard = wizard
-
-    def compose(self) -> ComposeResult:
-        yield Header()
-        yield Container(
-            Static(
-                Text.from_markup(
-                    "[bold green]✓ Configuration Complete![/]\n\n"
-                    f"Saved {len(self.wizard.user_mappings)} mappings to config.yaml\n\n"
-                    "You can now run:\n"
-                    "  python organize_profiles.py [--execute]\n\n"
-                    "to organize your profiles!"
-                )
-            ),
-            Button("Done", id="done-btn", variant="primary"),
-            id="success-container",
-        )
-        yield Footer()
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button press events"""
-        if event.button.id == "done-btn":
-            self.app.exit()
+    class WizardApp(App):
+        """Main Textual application"""
 
+        TITLE = "ICC Profile Organizer - Configuration Wizard"
+        BINDINGS = [
+            ("q", "quit", "Quit"),
+            Binding("ctrl+c", "quit", "Cancel", show=False),
+        ]
 
-class WizardApp(App):
-    """Main Textual application"""
+        def __init__(self):
+            super().__init__()
+            # One loaded ConfigManager for the whole app; every wizard the
+            # screens create shares it rather than re-parsing the YAML
+            self.config_manager = ConfigManager()
+            self.config_manager.load()
 
-    TITLE = "ICC Profile Organizer - Configuration Wizard"
-    BINDINGS = [
-        ("q", "quit", "Quit"),
-        Binding("ctrl+c", "quit", "Cancel", show=False),
-    ]
+        def on_mount(self) -> None:
+            self.push_screen(WelcomeScreen())
 
-    def on_mount(self) -> None:
-        self.push_screen(WelcomeScreen())
+    return WizardApp
 
 
 def main():
     """Run the wizard"""
-    app = WizardApp()
-    app.run()
+    app_cls = _build_app()
+    app_cls().run()
 
 
 if __name__ == "__main__":
@@ -4,11 +4,16 @@ ICC Profile, EMX/EMY2, and PDF Organizer
 Renames and organizes color profiles and documentation by Printer and Paper Brand.
 """
 
+import hashlib
+import mmap
+import os
+import re
 import sys
 import logging
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from rich.console import Console
@@ -16,15 +21,23 @@ try:
 except ImportError:
     HAS_RICH = False
 
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 from lib import (
     ICCProfileUpdater,
     ConfigManager,
     UserPreferences,
-    find_profile_files,
-    find_pdf_duplicates,
-    hash_file,
     get_duplicate_paths,
-    is_duplicate_file,
     find_printer_candidates,
     apply_printer_remapping,
     get_printer_name_interactive,
@@ -39,6 +52,38 @@ from lib import (
 )
 
 
+# Sentinel distinguishing "never matched" from a cached None result
+_MISSING = object()
+
+
+def _strip_prefix(text: str, prefix: str) -> str:
+    """str.removeprefix equivalent that still runs on Python 3.8."""
+    return text[len(prefix):] if text.startswith(prefix) else text
+
+
+_CONSOLE = None
+
+
+def _get_console():
+    """Return the shared rich Console, constructing it on first use."""
+    global _CONSOLE
+    if _CONSOLE is None and HAS_RICH:
+        _CONSOLE = Console()
+    return _CONSOLE
+
+# Profile extensions mapped to their file-type buckets
+_PROFILE_EXTS = {'icc': 'ICC', 'icm': 'ICM', 'emy2': 'EMY2'}
+
+# Special-case printer spellings found in directory names ("IPF 6450" vs
+# "iPF6450" etc.), matched in one case-insensitive pass instead of a chain
+# of substring checks
+_SPECIAL_PRINTER_RE = re.compile(r'(?i)(ipf\s*6450|pro-100)')
+_SPECIAL_PRINTER_MAP = {
+    'ipf6450': 'Canon iPF6450',
+    'pro-100': 'Canon Pixma PRO-100',
+}
+
+
 class ProfileOrganizer:
     """Organizes ICC profiles, EMX files, and PDFs."""
 
@@ -71,8 +116,8 @@ class ProfileOrganizer:
         self.detailed = detailed
         self.update_descriptions = update_descriptions
 
-        # Setup rich console for colored output
-        self.console = Console() if HAS_RICH else None
+        # Setup rich console for colored output (shared instance)
+        self.console = _get_console()
 
         # Setup logging
         self.setup_logging()
@@ -81,12 +126,53 @@ class ProfileOrganizer:
         self.config_manager = ConfigManager(verbose=False)
         self.config_manager.load()
 
+        # Printer keys sorted by length (longest first) once at load time, so
+        # candidate lookups prefer the most specific key without re-sorting
+        # or deduplicating per filename
+        self._printer_names_by_len = dict(
+            sorted(
+                self.config_manager.PRINTER_NAMES.items(),
+                key=lambda kv: -len(kv[0]),
+            )
+        )
+
+        # Lowercased printer keys, computed once instead of per directory
+        # comparison in the PDF context scan
+        self._printer_names_lc = [
+            (key.lower(), full_name)
+            for key, full_name in self._printer_names_by_len.items()
+        ]
+
+        # Short 4-character tokens, one per printer key: a filename that
+        # contains none of them can't mention any printer at all
+        self._printer_tokens = {key[:4] for key, _ in self._printer_names_lc}
+
+        # With pyahocorasick available, all printer keys are matched against
+        # a directory name in one pass instead of one substring test per key
+        self._printer_ac = None
+        if HAS_AHOCORASICK and self._printer_names_lc:
+            automaton = ahocorasick.Automaton()
+            for key_lc, full_name in self._printer_names_lc:
+                automaton.add_word(key_lc, (len(key_lc), full_name))
+            automaton.make_automaton()
+            self._printer_ac = automaton
+
         # User preferences manager
         self.preferences = UserPreferences(self.profiles_dir, verbose=False)
 
         # Storage for file operations
         self.operations = []  # List of (old_path, new_path) tuples
+        self.pdf_operations = []  # Subset of operations that target PDFs/
         self.pdf_duplicates = {}  # Hash -> list of paths
+        self._hash_cache = {}  # Path -> digest, so no file is hashed twice
+        self._match_cache = {}  # Filename -> match_filename result (may be None)
+        self._remap_cache = {}  # Printer name -> remapped canonical name
+        self._dir_printer_cache = {}  # Directory name -> inferred printer (may be None)
+
+        # Filled by _scan_tree: one traversal feeds both organize passes
+        self._tree_scanned = False
+        self._profile_entries = []  # (file_type, path, name, ext) tuples
+        self._pdf_files = []
         self.files_renamed = []
         self.files_deleted = []
         self.selected_system_profile_path = None
@@ -115,12 +201,25 @@ class ProfileOrganizer:
             handlers=[file_handler, console_handler]
         )
         self.logger = logging.getLogger(__name__)
-
-    def log(self, message: str, level: str = 'INFO'):
-        """Log a message."""
+        # Bind level methods once so log() avoids a getattr per call
+        self._log_fns = {
+            'DEBUG': self.logger.debug,
+            'INFO': self.logger.info,
+            'WARNING': self.logger.warning,
+            'ERROR': self.logger.error,
+        }
+
+    def log(self, message: str, level: str = 'INFO', *args):
+        """Log a message.
+
+        Extra args are handed to logging for lazy %-formatting, so hot
+        loops can skip building the message string when it won't be
+        emitted.
+        """
         # Always log errors and warnings, only log info/debug when verbose
-        if level.upper() in ('ERROR', 'WARNING') or self.verbose:
-            getattr(self.logger, level.lower())(message)
+        level = level.upper()
+        if level in ('ERROR', 'WARNING') or self.verbose:
+            self._log_fns[level](message, *args)
 
     def organize_profiles(self) -> bool:
         """
@@ -146,53 +245,80 @@ class ProfileOrganizer:
         self.log(f"Output directory: {self.output_dir}")
         self.log("=" * 60)
 
-        # Find all ICC, ICM, and EMY2 files
-        profile_files = find_profile_files(self.profiles_dir)
-
-        if not profile_files or not any(profile_files.values()):
-            self.log("No profile files found.", level='WARNING')
-            return False
-
-        self.log(f"\nFound {sum(len(f) for f in profile_files.values())} profile files:")
-        for ftype, files in profile_files.items():
-            if files:
-                self.log(f"  {ftype}: {len(files)} files")
-
-        # Process each profile type
-        all_files = []
-        for file_list in profile_files.values():
-            all_files.extend(file_list)
-
         # Track existing names to handle duplicates
         existing_names = {}
 
-        for file_path in all_files:
+        # Phase 1: stream ICC/ICM/EMY2 files straight from the walk and
+        # parse each filename, so no intermediate per-type lists are built
+        # and interactive prompts don't stall in the middle of the scan
+        type_counts = {}
+        unparsed = []
+        parsed = []
+        self._scan_tree()
+        for ftype, file_path, name, ext in self._profile_entries:
+            type_counts[ftype] = type_counts.get(ftype, 0) + 1
+
             # Extract printer, brand, paper type from filename
-            result = self.config_manager.match_filename(file_path.name)
+            result = self._match_filename(name)
             if not result:
-                self.log(f"  ⚠ Could not parse: {file_path.name}", level='WARNING')
+                unparsed.append(name)
                 continue
 
             printer, brand, paper_type = result
 
             if not printer or not brand:
-                self.log(f"  ⚠ Could not parse: {file_path.name}", level='WARNING')
+                unparsed.append(name)
+                continue
+
+            parsed.append([file_path, name, ext, printer, brand, paper_type])
+
+        total_found = sum(type_counts.values())
+        if not total_found:
+            self.log("No profile files found.", level='WARNING')
+            return False
+
+        self.log(f"\nFound {total_found} profile files:")
+        for ftype, count in type_counts.items():
+            self.log(f"  {ftype}: {count} files")
+
+        for name in unparsed:
+            self.log("  ⚠ Could not parse: %s", 'WARNING', name)
+
+        # Phase 2: resolve multi-printer files in one batch of prompts
+        for entry in parsed:
+            name, printer = entry[1], entry[3]
+
+            # Pre-screen with the automaton: a filename containing fewer
+            # than two printer keys can't need a multi-printer prompt, so
+            # the full candidate scan is skipped for the common case
+            name_lc = name.lower()
+            if self._printer_ac is not None:
+                hit_count = 0
+                for _ in self._printer_ac.iter(name_lc):
+                    hit_count += 1
+                    if hit_count > 1:
+                        break
+                if hit_count < 2:
+                    continue
+            elif not any(token in name_lc for token in self._printer_tokens):
+                # Without the automaton, a cheap token screen still rules
+                # out filenames that mention no printer key at all
                 continue
 
-            # Use interactive mode if enabled to choose printer for multi-printer files
-            candidates = find_printer_candidates(file_path.name, self.config_manager.PRINTER_NAMES)
+            candidates = find_printer_candidates(name, self._printer_names_by_len)
             if len(candidates) > 1:
-                printer = get_printer_name_interactive(
-                    file_path.name, printer, candidates,
+                entry[3] = get_printer_name_interactive(
+                    name, printer, candidates,
                     self.preferences.global_preferences,
                     self.interactive, self.preferences
                 )
 
+        # Phase 3: build the copy operations in original scan order
+        # Hoisted prefix so the detailed log avoids a relative_to per file
+        out_parent = f"{self.output_dir.parent}{os.sep}"
+        for file_path, name, ext, printer, brand, paper_type in parsed:
             # Apply printer remappings
-            printer = apply_printer_remapping(printer, self.config_manager.PRINTER_REMAPPINGS)
-
-            # Determine extension
-            ext = file_path.suffix.lstrip('.')
+            printer = self._remap_printer(printer)
 
             # Generate new filename
             new_filename = generate_new_filename(printer, brand, paper_type, ext, existing_names)
@@ -204,7 +330,7 @@ class ProfileOrganizer:
 
             # Only print if detailed mode is enabled
             if self.detailed:
-                self.log(f"  {file_path.name} -> {new_path.relative_to(self.output_dir.parent)}")
+                self.log("  %s -> %s", 'INFO', name, _strip_prefix(str(new_path), out_parent))
 
         # Show summary organized by printer/brand
         if not self.detailed:
@@ -230,8 +356,9 @@ class ProfileOrganizer:
             self.log("Starting PDF Organization")
         self.log("=" * 60)
 
-        # Find all PDFs
-        pdf_files = list(self.profiles_dir.rglob('*.pdf'))
+        # Find all PDFs (from the shared single-traversal scan)
+        self._scan_tree()
+        pdf_files = self._pdf_files
 
         if not pdf_files:
             self.log("No PDF files found.")
@@ -239,28 +366,63 @@ class ProfileOrganizer:
 
         self.log(f"Found {len(pdf_files)} PDF files")
 
-        # Calculate hashes and find duplicates
-        self.pdf_duplicates = find_pdf_duplicates(pdf_files)
-
-        duplicates_found = sum(1 for v in self.pdf_duplicates.values() if len(v) > 1)
-        self.log(f"Found {duplicates_found} duplicate sets")
+        # Group by size first: only files sharing a byte size can possibly
+        # be duplicates, so singletons are never read at all
+        by_size = defaultdict(list)
+        for file_path in pdf_files:
+            by_size[file_path.stat().st_size].append(file_path)
+
+        size_candidates = [
+            (file_path, size)
+            for size, group in by_size.items() if len(group) > 1
+            for file_path in group
+        ]
+
+        # Calculate keys and hashes in parallel; hashlib releases the GIL,
+        # so worker threads overlap disk reads with hash computation
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            # Second stage: a 4 KiB-head digest rules out same-size files
+            # that differ immediately, so only genuine collisions are read
+            # in full
+            quick_keys = executor.map(
+                self._quick_key,
+                (p for p, _ in size_candidates),
+                (s for _, s in size_candidates),
+            )
+            by_quick = defaultdict(list)
+            for (file_path, _), key in zip(size_candidates, quick_keys):
+                by_quick[key].append(file_path)
+
+            candidates = [p for group in by_quick.values() if len(group) > 1 for p in group]
+            hashes = list(executor.map(self._hash_file, candidates))
+
+        pdf_duplicates = defaultdict(list)
+        for file_path, file_hash in zip(candidates, hashes):
+            pdf_duplicates[file_hash].append(file_path)
+        # Only real duplicate groups need to stay alive for reporting
+        self.pdf_duplicates = {h: paths for h, paths in pdf_duplicates.items() if len(paths) > 1}
+
+        self.log(f"Found {len(self.pdf_duplicates)} duplicate sets")
 
         # Track existing names to handle duplicates
         existing_names = {}
 
-        # Process PDFs
+        # Process PDFs in one streaming pass: the first file seen for a
+        # digest is kept, later ones are duplicates
+        seen = {}
+        delete_targets = []
+        src_prefix = f"{self.profiles_dir}{os.sep}"
         for file_path in pdf_files:
-            # Check if this is a duplicate (not the first occurrence)
-            file_hash = hash_file(file_path)
+            # Only size-collision candidates were hashed; anything without a
+            # cached digest is unique by size and can't be a duplicate
+            file_hash = self._hash_cache.get(file_path)
 
-            if is_duplicate_file(file_hash, self.pdf_duplicates, file_path):
+            if file_hash is not None and seen.setdefault(file_hash, file_path) is not file_path:
                 # This is a duplicate
-                self.log(f"  DUPLICATE: {file_path.relative_to(self.profiles_dir)}")
+                if self.verbose:
+                    self.log("  DUPLICATE: %s", 'INFO', _strip_prefix(str(file_path), src_prefix))
                 self.files_deleted.append(str(file_path))
-
-                if not self.dry_run:
-                    file_path.unlink()
-                    self.log(f"    → Deleted")
+                delete_targets.append(file_path)
             else:
                 # This is a unique file, organize it
                 # Try to extract printer from filename or parent folder
@@ -270,14 +432,23 @@ class ProfileOrganizer:
                     ext = file_path.suffix.lstrip('.')
                     new_filename = generate_new_filename(printer, 'PDFs', file_path.stem, ext, existing_names)
                     new_path = self.output_dir / 'PDFs' / printer / new_filename
-                    self.operations.append((file_path, new_path))
+                    operation = (file_path, new_path)
+                    self.operations.append(operation)
+                    self.pdf_operations.append(operation)
                     if self.detailed:
-                        self.log(f"  {file_path.relative_to(self.profiles_dir)} -> PDFs/{printer}/{new_filename}")
+                        self.log("  %s -> PDFs/%s/%s", 'INFO',
+                                 _strip_prefix(str(file_path), src_prefix), printer, new_filename)
+
+        # Delete duplicates in parallel; unlink is a pure syscall that
+        # releases the GIL, so a pool pipelines the metadata operations
+        if not self.dry_run and delete_targets:
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                list(executor.map(Path.unlink, delete_targets))
+            self.log(f"  → Deleted {len(delete_targets)} duplicate files")
 
         # Show PDF organization summary
-        pdf_ops = [op for op in self.operations if 'PDFs' in str(op[1])]
-        if not self.detailed and pdf_ops:
-            print_pdf_organization_summary(pdf_ops, len(self.files_deleted), verbose=True)
+        if not self.detailed and self.pdf_operations:
+            print_pdf_organization_summary(self.pdf_operations, len(self.files_deleted), verbose=True)
 
         # Execute operations if not dry run
         if not self.dry_run:
@@ -286,30 +457,194 @@ class ProfileOrganizer:
 
         return True
 
-    def _extract_printer_from_context(self, file_path: Path) -> Optional[str]:
-        """Extract printer name from file path context (filename first, then parent dirs)."""
+    def _scan_tree(self):
+        """Walk the source tree once, partitioning profiles and PDFs.
+
+        Both organize passes consume this single os.scandir traversal, so
+        the tree is read one time per run no matter which passes run.
+        DirEntry carries type information from the directory read itself,
+        so no extra stat is issued per entry, and macOS resource-fork
+        files are skipped on the raw name before any Path is built. The
+        name and extension ride along so downstream loops don't recompute
+        them through pathlib accessors.
+        """
+        if self._tree_scanned:
+            return
+        self._tree_scanned = True
+
+        stack = [os.fspath(self.profiles_dir)]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith('._'):
+                        continue
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        stack.append(entry.path)
+                        continue
+                    ext = name.rsplit('.', 1)[-1]
+                    ext_lc = ext.lower()
+                    ftype = _PROFILE_EXTS.get(ext_lc)
+                    if ftype is not None:
+                        self._profile_entries.append((ftype, Path(entry.path), name, ext))
+                    elif ext_lc == 'pdf':
+                        self._pdf_files.append(Path(entry.path))
+
+    def _remap_printer(self, printer_name: str) -> str:
+        """Apply printer remapping, memoized per distinct input name.
+
+        Remapping runs once per file plus once per PDF directory hit, but
+        the set of distinct printer names is tiny.
+        """
+        remapped = self._remap_cache.get(printer_name)
+        if remapped is None:
+            remapped = apply_printer_remapping(printer_name, self.config_manager.PRINTER_REMAPPINGS)
+            self._remap_cache[printer_name] = remapped
+        return remapped
+
+    def _match_filename(self, filename: str):
+        """Match a filename against the configured patterns, memoized.
+
+        Profiles and their companion PDFs often share stems, so the same
+        name can come through more than once per run.
+        """
+        result = self._match_cache.get(filename, _MISSING)
+        if result is _MISSING:
+            result = self.config_manager.match_filename(filename)
+            if result:
+                # Intern the canonical names: thousands of files repeat the
+                # same few printer/brand strings, and interned keys make
+                # the summary dicts compare by pointer
+                printer, brand, paper_type = result
+                result = (
+                    sys.intern(printer) if printer else printer,
+                    sys.intern(brand) if brand else brand,
+                    sys.intern(paper_type) if paper_type else paper_type,
+                )
+            self._match_cache[filename] = result
+        return result
+
+    @staticmethod
+    def _quick_key(file_path: Path, size: int) -> tuple:
+        """Cheap pre-filter key: byte size plus a digest of the file's edges.
+
+        PDFs that differ often differ in the header or the trailer (where
+        the xref table lives), so hashing the first and last 64 KiB rules
+        out most same-size non-duplicates without a full read.
+        """
+        edge = 64 * 1024
+        h = hashlib.blake2b(digest_size=8)
+        with open(file_path, 'rb') as f:
+            h.update(f.read(edge))
+            if size > 2 * edge:
+                f.seek(size - edge)
+                h.update(f.read(edge))
+        return (size, h.digest())
+
+    @staticmethod
+    def _dedup_hash(file_path: Path) -> str:
+        """Content digest used only for duplicate detection.
+
+        This is a pure equality check, not a security boundary, so the
+        cheapest adequate hash wins: xxh3 (when the optional xxhash
+        package is installed) is about an order of magnitude faster than
+        SHA-256, and the BLAKE2b fallback still roughly 3x faster.
+
+        Larger files are fed to the hasher through an mmap'd memoryview,
+        so bytes come straight from the page cache without a per-chunk
+        allocation; small files stay on plain buffered reads.
+        """
+        h = xxhash.xxh3_128() if HAS_XXHASH else hashlib.blake2b(digest_size=16)
+        chunk_size = 1024 * 1024
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > 64 * 1024:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            for offset in range(0, size, chunk_size):
+                                h.update(view[offset:offset + chunk_size])
+                    return h.hexdigest()
+                except (OSError, ValueError):
+                    pass  # e.g. unusual filesystems; fall back to reads
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _hash_file(self, file_path: Path) -> str:
+        """Hash a file, reusing any digest computed earlier in the run."""
+        file_hash = self._hash_cache.get(file_path)
+        if file_hash is None:
+            file_hash = self._dedup_hash(file_path)
+            self._hash_cache[file_path] = file_hash
+        return file_hash
+
+    def _extract_printer_from_context(self, file_path: Path, parsed: Optional[Tuple] = None) -> Optional[str]:
+        """Extract printer name from file path context (filename first, then parent dirs).
+
+        Callers that already matched the filename can pass the
+        (printer, brand, paper_type) tuple as ``parsed`` to skip the
+        pattern engine entirely.
+        """
         # First, try to extract from filename
-        result = self.config_manager.match_filename(file_path.name)
+        result = parsed if parsed is not None else self._match_filename(file_path.name)
         if result:
             printer_name, _, _ = result
-            return apply_printer_remapping(printer_name, self.config_manager.PRINTER_REMAPPINGS)
+            return self._remap_printer(printer_name)
 
         # Check parent directory name and all parents
         for parent in [file_path.parent] + list(file_path.parents):
-            parent_name = parent.name
+            printer = self._printer_for_dirname(parent.name)
+            if printer is not None:
+                return printer
+
+        return 'Uncategorized'
 
-            # Look for exact and case-insensitive matches
-            for key, full_name in self.config_manager.PRINTER_NAMES.items():
-                if key.lower() in parent_name.lower():
-                    return apply_printer_remapping(full_name, self.config_manager.PRINTER_REMAPPINGS)
+    def _printer_for_dirname(self, parent_name: str) -> Optional[str]:
+        """Infer a printer from one directory name, memoized.
 
+        PDFs cluster under the same few directories, so each distinct name
+        is scanned once per run.
+        """
+        printer = self._dir_printer_cache.get(parent_name, _MISSING)
+        if printer is not _MISSING:
+            return printer
+
+        printer = None
+        parent_lc = parent_name.lower()
+
+        # Look for exact and case-insensitive matches, preferring the
+        # longest (most specific) printer key
+        if self._printer_ac is not None:
+            best = None
+            for _, (key_len, full_name) in self._printer_ac.iter(parent_lc):
+                if best is None or key_len > best[0]:
+                    best = (key_len, full_name)
+            if best is not None:
+                printer = self._remap_printer(best[1])
+        else:
+            for key_lc, full_name in self._printer_names_lc:
+                if key_lc in parent_lc:
+                    printer = self._remap_printer(full_name)
+                    break
+
+        if printer is None:
             # Special handling for patterns like "IPF 6450" vs "iPF6450"
-            if 'iPF6450' in parent_name or 'ipf6450' in parent_name or 'IPF 6450' in parent_name or 'ipf 6450' in parent_name:
-                return 'Canon iPF6450'
-            if 'PRO-100' in parent_name or 'Pro-100' in parent_name or 'pro-100' in parent_name:
-                return 'Canon Pixma PRO-100'
+            match = _SPECIAL_PRINTER_RE.search(parent_name)
+            if match:
+                printer = _SPECIAL_PRINTER_MAP[match.group(1).lower().replace(' ', '')]
 
-        return 'Uncategorized'
+        self._dir_printer_cache[parent_name] = printer
+        return printer
 
     def update_profile_descriptions(self) -> bool:
         """
@@ -457,8 +792,7 @@ def main():
     # Validate arguments
     if args.profiles_only and args.pdfs_only:
         if HAS_RICH:
-            console = Console()
-            console.print("[bold red]Error: Cannot use both --profiles-only and --pdfs-only[/bold red]")
+            _get_console().print("[bold red]Error: Cannot use both --profiles-only and --pdfs-only[/bold red]")
         else:
             print("Error: Cannot use both --profiles-only and --pdfs-only")
         sys.exit(1)
@@ -503,15 +837,13 @@ def main():
 
     except KeyboardInterrupt:
         if HAS_RICH:
-            console = Console()
-            console.print("\n\n[yellow]Operation cancelled by user[/yellow]")
+            _get_console().print("\n\n[yellow]Operation cancelled by user[/yellow]")
         else:
             print("\n\nOperation cancelled by user")
         sys.exit(1)
     except Exception as e:
         if HAS_RICH:
-            console = Console()
-            console.print(f"[bold red]Error: {e}[/bold red]")
+            _get_console().print(f"[bold red]Error: {e}[/bold red]")
         else:
             print(f"Error: {e}")
         sys.exit(1)